@@ -75,6 +75,7 @@ sudo apt-get update -y || warn "apt-get update returned non-zero -- continuing."
 info "Installing base packages..."
 sudo apt-get install -y \
     python3-lgpio python3-pip python3-venv \
+    libyaml-dev \
     librtlsdr-dev rtl-sdr \
     i2c-tools \
     git curl jq
@@ -2,19 +2,20 @@
 """Bench-test CLI using Waveshare HR8825 driver as backend.
 DIPs all-1 required (software microstep mode).
 """
-import sys, time
+import contextlib, ctypes, functools, os, sys, time
 from pathlib import Path
 import click
-import yaml
 
-# Make tracker package importable
+# Make tracker package importable. tracker.* (yaml, numpy, GPIO libs) is
+# imported inside the commands so --help stays instant and works off-Pi.
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from tracker.hr8825 import HR8825
 
 
+@functools.lru_cache(maxsize=None)
 def load_pins(config_path: Path):
     try:
-        d = yaml.safe_load(config_path.read_text())["tracker"]
+        from tracker.config import load_config
+        d = load_config(config_path)["tracker"]
         az = d["azimuth"]; el = d["elevation"]
         return {
             1: dict(dir_pin=az["dir_pin"], step_pin=az["step_pin"],
@@ -30,12 +31,48 @@ def load_pins(config_path: Path):
         }
 
 
+@functools.lru_cache(maxsize=None)   # once per process
+def enter_realtime():
+    """Best-effort SCHED_FIFO + mlockall so step timing isn't preempted or paged."""
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+    except (AttributeError, OSError) as e:
+        click.echo(f"[warn] SCHED_FIFO unavailable ({e}); step timing may jitter")
+    try:
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        if libc.mlockall(1 | 2) != 0:   # MCL_CURRENT | MCL_FUTURE
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+    except OSError as e:
+        click.echo(f"[warn] mlockall failed ({e}); page faults may stall pulses")
+
+
+@contextlib.contextmanager
+def motor_session(ctx, motor, microstep):
+    """Claim one motor's pins, set microstepping, and always de-energise on exit.
+
+    Stop() runs in the finally, so Ctrl-C (or any error) mid-move still drops
+    ENABLE — lgpio pulses keep running in the background otherwise.
+    """
+    from tracker.hr8825 import HR8825
+    pins = load_pins(ctx.obj["config_path"])[motor]
+    enter_realtime()
+    m = HR8825(**pins, verbose=not ctx.obj["quiet"])
+    try:
+        m.SetMicroStep("softward", microstep)
+        yield m
+    finally:
+        m.Stop()
+
+
 @click.group()
 @click.option("--config", "config_path", type=click.Path(path_type=Path),
               default=Path(__file__).resolve().parent.parent / "tracker/config.yaml")
+@click.option("--quiet", "-q", is_flag=True, help="Only print warnings.")
 @click.pass_context
-def cli(ctx, config_path):
-    ctx.obj = load_pins(Path(config_path))
+def cli(ctx, config_path, quiet):
+    # Pins and RT scheduling are resolved by the commands that pulse motors,
+    # so `spin --help` and friends never read the config.
+    ctx.obj = dict(config_path=Path(config_path), quiet=quiet)
 
 
 @cli.command()
@@ -45,27 +82,56 @@ def cli(ctx, config_path):
 @click.option("--dir", "direction", type=click.Choice(["cw", "ccw"]), required=True)
 @click.option("--microstep", default="fullstep",
               type=click.Choice(["fullstep","halfstep","1/4step","1/8step","1/16step","1/32step"]))
+@click.option("--accel", type=float, default=0.0, show_default=True,
+              help="Ramp acceleration in steps/s^2 (0 = constant rate).")
 @click.pass_context
-def spin(ctx, motor, steps, speed, direction, microstep):
-    pins = ctx.obj[motor]
-    m = HR8825(**pins)
-    m.SetMicroStep("softward", microstep)
-    stepdelay = 0.5 / max(speed, 1.0)   # half-period each side of pulse
+def spin(ctx, motor, steps, speed, direction, microstep, accel):
+    from tracker.motion import ramp_delays
+    quiet = ctx.obj["quiet"]
     Dir = "forward" if direction == "cw" else "backward"
-    click.echo(f"motor {motor}: {steps} {microstep} steps {direction} @ {speed} sps")
-    m.TurnStep(Dir=Dir, steps=steps, stepdelay=stepdelay)
-    m.Stop()
-    click.echo("done")
+    if not quiet:
+        click.echo(f"motor {motor}: {steps} {microstep} steps {direction} @ {speed} sps")
+    with motor_session(ctx, motor, microstep) as m:
+        if accel > 0:
+            m.TurnRamp(Dir=Dir, stepdelays=ramp_delays(steps, speed, accel))
+        else:
+            stepdelay = 0.5 / max(speed, 1.0)   # half-period each side of pulse
+            m.TurnStep(Dir=Dir, steps=steps, stepdelay=stepdelay)
+    if not quiet:
+        click.echo("done")
 
 
 @cli.command("test-all")
 @click.pass_context
 def test_all(ctx):
-    for motor in (1, 2):
-        ctx.invoke(spin, motor=motor, steps=200, speed=100, direction="cw", microstep="fullstep")
-        time.sleep(0.5)
-        ctx.invoke(spin, motor=motor, steps=200, speed=100, direction="ccw", microstep="fullstep")
+    """CW then CCW on each motor; both motors at once when lgpio drives them."""
+    from tracker import hr8825
+    if hr8825.lgpio is None:
+        # Software stepping busy-waits each edge: two loops would fight over
+        # the GIL and wreck each other's timing, so run the motors in turn.
+        for motor in (1, 2):
+            ctx.invoke(spin, motor=motor, steps=200, speed=100, direction="cw", microstep="fullstep")
+            time.sleep(0.5)
+            ctx.invoke(spin, motor=motor, steps=200, speed=100, direction="ccw", microstep="fullstep")
+        return
 
+    # lgpio pulses from its own C thread: queue both trains, then wait on both.
+    # One thread, so Ctrl-C or an error still unwinds into both sessions' Stop().
+    quiet = ctx.obj["quiet"]
+    with contextlib.ExitStack() as stack:
+        motors = [stack.enter_context(motor_session(ctx, motor, "fullstep"))
+                  for motor in (1, 2)]
+        for Dir, direction in (("forward", "cw"), ("backward", "ccw")):
+            if not quiet:
+                click.echo(f"motors 1+2: 200 fullstep steps {direction} @ 100 sps")
+            for m in motors:
+                m.TurnStep(Dir=Dir, steps=200, stepdelay=0.005, wait=False)
+            for m in motors:
+                m.Wait()
+            if direction == "cw":
+                time.sleep(0.5)
+    if not quiet:
+        click.echo("done")
 
 if __name__ == "__main__":
     cli()
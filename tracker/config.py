@@ -0,0 +1,56 @@
+"""Cached loader for the tracker config YAML.
+
+The CLIs, the controller factory and the web dashboard all read
+tracker/config.yaml. Parsing it with PyYAML is slow relative to everything
+else those callers do, so parsed configs are kept in a small in-process LRU
+and only re-parsed when the file on disk changes.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml's C parser/emitter when available; pure-Python safe ones otherwise.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_CACHE_SIZE = 4
+
+# abs path -> (st_mtime_ns, st_size, parsed config)
+_cache: OrderedDict[str, tuple[int, int, dict[str, Any]]] = OrderedDict()
+
+
+def load_config(path: str | Path) -> dict[str, Any]:
+    """Parse a config YAML, reusing the previous parse while the file is unchanged.
+
+    Entries are keyed by absolute path and validated against mtime + size, so
+    an edit on disk (e.g. /api/set-limit) forces a re-parse. A deep copy is
+    returned, so callers may mutate the result freely.
+    """
+    p = Path(path).resolve()
+    st = p.stat()
+    key = str(p)
+
+    hit = _cache.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        _cache.move_to_end(key)
+        return copy.deepcopy(hit[2])
+
+    with p.open("r", encoding="utf-8") as fh:
+        cfg = yaml.load(fh, Loader=_Loader) or {}
+    _cache[key] = (st.st_mtime_ns, st.st_size, cfg)
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return copy.deepcopy(cfg)
+
+
+def save_config(path: str | Path, cfg: dict[str, Any]) -> None:
+    """Write a config back to YAML in the same block style it was loaded from."""
+    with Path(path).open("w", encoding="utf-8") as fh:
+        yaml.dump(cfg, fh, Dumper=_Dumper, sort_keys=False, default_flow_style=False)
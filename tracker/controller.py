@@ -9,16 +9,15 @@ from __future__ import annotations
 
 import math
 import threading
-from .hr8825 import HR8825  # Waveshare reference driver
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import click
-import yaml
-from rich.console import Console
-from rich.table import Table
+
+from .config import load_config
+from .motion import ramp_delays
 
 try:
     import lgpio  # type: ignore
@@ -108,16 +107,23 @@ class StepperAxis:
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def __post_init__(self) -> None:
+        # Step geometry and the speed/accel limits in steps are fixed by config,
+        # so compute them once instead of on every step/move.
+        self._degrees_per_step = 360.0 / self.total_steps_per_rev
+        self._max_sps = max(self.max_speed / self._degrees_per_step, 1.0)
+        self._accel_sps2 = self.acceleration / self._degrees_per_step
         # Real-hardware mode: use Waveshare HR8825 driver. Sim mode: keep _SimGpio for state-only updates.
         self._driver = None
         if self.gpio is None or isinstance(self.gpio, _SimGpio):
             if self.gpio is None:
                 self.gpio = _SimGpio()
             return
+        from .hr8825 import HR8825  # lazy: pulls in lgpio / RPi.GPIO
         # Pick mode pins per axis name (matches config.yaml convention)
         mode_pins = (16, 17, 20) if self.name == "azimuth" else (21, 22, 27)
         self._driver = HR8825(dir_pin=self.dir_pin, step_pin=self.step_pin,
-                              enable_pin=self.enable_pin, mode_pins=mode_pins)
+                              enable_pin=self.enable_pin, mode_pins=mode_pins,
+                              verbose=False)
         self._driver.SetMicroStep("softward", "fullstep")
 
     # ---- conversions ----
@@ -128,7 +134,7 @@ class StepperAxis:
 
     @property
     def degrees_per_step(self) -> float:
-        return 360.0 / self.total_steps_per_rev
+        return self._degrees_per_step
 
     @property
     def position_steps(self) -> int:
@@ -158,13 +164,13 @@ class StepperAxis:
         if self._driver is not None:
             d = "forward" if direction > 0 else "backward"
             self._driver.TurnStep(Dir=d, steps=1, stepdelay=0.005)
-        self.position_deg += direction * self.degrees_per_step
+        self.position_deg += direction * self._degrees_per_step
 
     def stop(self) -> None:
         self._stop_flag.set()
 
     def move_steps(self, n_steps: int, direction: int) -> None:
-        """Move n_steps. Real hw: HR8825.TurnStep (constant rate). Sim: just bump state."""
+        """Move n_steps. Real hw: HR8825.TurnRamp (accel/decel ramp). Sim: just bump state."""
         if n_steps <= 0:
             return
         with self._lock:
@@ -173,19 +179,18 @@ class StepperAxis:
                 self.enable()
             if self._driver is not None:
                 d = "forward" if direction > 0 else "backward"
-                # stepdelay is half-period each side; pick from max_speed (steps/s)
-                v_max_steps = max(self.max_speed / self.degrees_per_step, 1.0)
-                stepdelay = 0.5 / v_max_steps
-                self._driver.TurnStep(Dir=d, steps=n_steps, stepdelay=stepdelay)
-                self.position_deg += direction * self.degrees_per_step * n_steps
+                # Trapezoidal profile from config acceleration, capped at max_speed.
+                delays = ramp_delays(n_steps, self._max_sps, self._accel_sps2)
+                self._driver.TurnRamp(Dir=d, stepdelays=delays)
+                self.position_deg += direction * self._degrees_per_step * n_steps
             else:
                 # sim path — instantaneous bookkeeping
-                self.position_deg += direction * self.degrees_per_step * n_steps
+                self.position_deg += direction * self._degrees_per_step * n_steps
 
     def goto_deg(self, target_deg: float) -> None:
         target = max(self.min_angle, min(self.max_angle, target_deg))
         delta_deg = target - self.position_deg
-        n_steps = int(round(abs(delta_deg) / self.degrees_per_step))
+        n_steps = int(round(abs(delta_deg) / self._degrees_per_step))
         if n_steps == 0:
             return
         direction = +1 if delta_deg > 0 else -1
@@ -232,9 +237,7 @@ class AntennaTracker:
         path: str | Path,
         gpio_backend: str = "auto",
     ) -> AntennaTracker:
-        cfg_path = Path(path)
-        with cfg_path.open("r", encoding="utf-8") as fh:
-            cfg = yaml.safe_load(fh)
+        cfg = load_config(path)
 
         tracker_cfg = cfg["tracker"]
         gpio = cls._make_gpio(gpio_backend)
@@ -343,6 +346,9 @@ def _load(config: str, sim: bool) -> AntennaTracker:
 
 
 def _render_status(tracker: AntennaTracker) -> None:
+    from rich.console import Console  # lazy: only the CLI renders tables
+    from rich.table import Table
+
     s = tracker.status()
     console = Console()
     table = Table(title=f"Antenna tracker status (mode={s['mode']})")
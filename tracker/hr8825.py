@@ -1,6 +1,16 @@
-import RPi.GPIO as GPIO
+import functools
+import itertools
 import time
 
+import numpy as np
+
+# lgpio is the supported GPIO path on Trixie; RPi.GPIO is the Waveshare fallback.
+try:
+    import lgpio  # type: ignore
+except ImportError:
+    lgpio = None  # type: ignore
+    import RPi.GPIO as GPIO
+
 MotorDir = [
     'forward',
     'backward',
@@ -11,13 +21,83 @@ ControlMode = [
     'softward',
 ]
 
+# Below this, nanosleep's ~50-100 us floor and jitter dominate: spin instead.
+_SPIN_NS = 2_000_000
+
+
+def _quiet(*args):
+    pass
+
+
+# One gpiochip handle per process, shared by every HR8825 instance. lgpio
+# refuses to claim a line another handle already holds ("GPIO busy"), so a
+# re-created driver (test-all, repeated spins) has to reuse the handle and the
+# claims made on it.
+_chip_handle = None
+_claimed = set()
+
+
+def _chip():
+    global _chip_handle
+    if _chip_handle is None:
+        _chip_handle = lgpio.gpiochip_open(0)
+    return _chip_handle
+
+
+def _claim(pins):
+    """Claim an output pin, or a tuple of pins as one group, once per process."""
+    if pins in _claimed:
+        return
+    if isinstance(pins, tuple):
+        lgpio.group_claim_output(_chip(), list(pins))
+    else:
+        lgpio.gpio_claim_output(_chip(), pins, 0)
+    _claimed.add(pins)
+
+
+def _lgpio_group_write(handle, leader, values):
+    bits = 0
+    for i, v in enumerate(values):
+        bits |= int(v) << i
+    lgpio.group_write(handle, leader, bits, (1 << len(values)) - 1)
+
+
+def _sleep_until(deadline_ns, _now=time.monotonic_ns, _sleep=time.sleep):
+    # Clock/sleep bound as defaults: LOAD_FAST in the spin instead of a
+    # global + attribute lookup per iteration.
+    remaining = deadline_ns - _now()
+    if remaining > _SPIN_NS:
+        _sleep((remaining - _SPIN_NS // 2) / 1e9)
+    while _now() < deadline_ns:
+        pass
+
+
 class HR8825():
-    def __init__(self, dir_pin, step_pin, enable_pin, mode_pins):
+    def __init__(self, dir_pin, step_pin, enable_pin, mode_pins, verbose=True):
         self.dir_pin = dir_pin
         self.step_pin = step_pin        
         self.enable_pin = enable_pin
         self.mode_pins = mode_pins
-        
+        # Chatter goes to stdout per call; StepperAxis single-steps through
+        # TurnStep, so it turns this off to keep prints off the step path.
+        self._log = print if verbose else _quiet
+
+        # Backend is fixed per instance: bind the write once so digital_write
+        # and the step loop don't re-dispatch on every edge.
+        if lgpio is not None:
+            self._h = _chip()
+            self._tx_done = 0.0
+            for pin in (dir_pin, step_pin, enable_pin):
+                _claim(pin)
+            # M0-M2 as one group: a microstep change is a single group_write.
+            _claim(tuple(mode_pins))
+            self._write = functools.partial(lgpio.gpio_write, self._h)
+            self._write_mode = functools.partial(_lgpio_group_write, self._h, mode_pins[0])
+            return
+
+        self._write = GPIO.output
+        self._write_mode = functools.partial(GPIO.output, list(mode_pins))
+
         GPIO.setmode(GPIO.BCM)
         GPIO.setwarnings(False)
         GPIO.setup(self.dir_pin, GPIO.OUT)
@@ -26,7 +106,11 @@ class HR8825():
         GPIO.setup(self.mode_pins, GPIO.OUT)
         
     def digital_write(self, pin, value):
-        GPIO.output(pin, value)
+        if isinstance(pin, (tuple, list)):
+            for p, v in zip(pin, value):
+                self._write(p, int(v))
+        else:
+            self._write(pin, int(value))
         
     def Stop(self):
         self.digital_write(self.enable_pin, 0)
@@ -47,31 +131,103 @@ class HR8825():
                      '1/16step': (0, 0, 1),
                      '1/32step': (1, 0, 1)}
 
-        print("Control mode:",mode)
+        self._log("Control mode:",mode)
         if (mode == ControlMode[1]):
-            print("set pins")
-            self.digital_write(self.mode_pins, microstep[stepformat])
+            self._log("set pins")
+            self._write_mode(microstep[stepformat])
         
-    def TurnStep(self, Dir, steps, stepdelay=0.005):
+    def _set_direction(self, Dir):
         if (Dir == MotorDir[0]):
-            print("forward")
+            self._log("forward")
             self.digital_write(self.enable_pin, 1)
             self.digital_write(self.dir_pin, 0)
         elif (Dir == MotorDir[1]):
-            print("backward")
+            self._log("backward")
             self.digital_write(self.enable_pin, 1)
             self.digital_write(self.dir_pin, 1)
         else:
             print("the dir must be : 'forward' or 'backward'")
             self.digital_write(self.enable_pin, 0)
+            return False
+        return True
+
+    def TurnStep(self, Dir, steps, stepdelay=0.005, wait=True):
+        """wait=False returns as soon as an lgpio pulse train is queued (see Wait)."""
+        if not self._set_direction(Dir):
             return
 
-        if (steps == 0):
+        if (steps <= 0):
             return
             
-        print("turn step:",steps)
-        for i in range(steps):
-            self.digital_write(self.step_pin, True)
-            time.sleep(stepdelay)
-            self.digital_write(self.step_pin, False)
-            time.sleep(stepdelay)
+        self._log("turn step:",steps)
+        if lgpio is not None:
+            self._pulse_train(steps, stepdelay, wait)
+            return
+        self._bitbang(itertools.repeat(int(stepdelay * 1e9), steps))
+
+    def Wait(self):
+        """Block until the last TurnStep pulse train has gone out.
+
+        Only lgpio moves can be left running; the RPi.GPIO loop has already
+        finished by the time TurnStep returns, so this is a no-op there.
+        """
+        if lgpio is None:
+            return
+        time.sleep(max(self._tx_done - time.monotonic(), 0.0))
+        while lgpio.tx_busy(self._h, self.step_pin, lgpio.TX_PWM):
+            time.sleep(0.001)
+
+    def TurnRamp(self, Dir, stepdelays):
+        """Like TurnStep, but with a per-step half-period (see motion.ramp_delays)."""
+        if not self._set_direction(Dir):
+            return
+        if len(stepdelays) == 0:
+            return
+
+        self._log("turn ramp:",len(stepdelays))
+        if lgpio is not None:
+            self._pulse_wave(stepdelays)
+            return
+        self._bitbang((np.asarray(stepdelays) * 1e9).astype(int).tolist())
+
+    def _bitbang(self, half_periods_ns):
+        """Software STEP loop, scheduled against absolute monotonic deadlines.
+
+        Each edge targets the previous deadline plus one half-period, so sleep
+        overshoot on one edge is absorbed by the next instead of accumulating.
+        """
+        write, pin, sleep_until = self._write, self.step_pin, _sleep_until
+        deadline = time.monotonic_ns()
+        for half_ns in half_periods_ns:
+            write(pin, 1)
+            deadline += half_ns
+            sleep_until(deadline)
+            write(pin, 0)
+            deadline += half_ns
+            sleep_until(deadline)
+
+    def _pulse_train(self, steps, stepdelay, wait=True):
+        """Emit `steps` STEP pulses from lgpio's C pulse thread.
+
+        One tx_pulse call replaces 2*steps Python writes + sleeps, so the step
+        rate is no longer bounded by interpreter and nanosleep jitter.
+        """
+        half_us = max(int(stepdelay * 1e6), 1)
+        lgpio.tx_pulse(self._h, self.step_pin, half_us, half_us, 0, steps)
+        self._tx_done = time.monotonic() + steps * 2 * stepdelay
+        if wait:
+            self.Wait()
+
+    def _pulse_wave(self, stepdelays):
+        """Queue a variable-rate STEP waveform (one high + one low per step)."""
+        half_us = np.maximum((np.asarray(stepdelays) * 1e6).astype(int), 1)
+        pulse = lgpio.pulse
+        pulses = []
+        append = pulses.append
+        for us in half_us.tolist():
+            append(pulse(1, 1, us))
+            append(pulse(0, 1, us))
+        lgpio.tx_wave(self._h, self.step_pin, pulses)
+        time.sleep(2e-6 * int(half_us.sum()))
+        while lgpio.tx_busy(self._h, self.step_pin, lgpio.TX_WAVE):
+            time.sleep(0.001)
@@ -0,0 +1,26 @@
+"""Step-timing schedules for the stepper drivers.
+
+Pure NumPy, no GPIO: the schedules are computed here and handed to
+HR8825.TurnRamp, so they can be built and checked off the Pi.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def ramp_delays(steps: int, max_sps: float, accel_sps2: float) -> np.ndarray:
+    """Per-step half-periods for a symmetric trapezoidal move.
+
+    Constant-acceleration timing from rest (AVR446): step i fires at
+    sqrt(2*i/a), so its interval is sqrt(2/a) * (sqrt(i+1) - sqrt(i)). The
+    schedule is mirrored about the midpoint for deceleration and floored at
+    the max_sps period. accel_sps2 <= 0 gives a constant-rate move.
+    """
+    period_min = 1.0 / max(max_sps, 1.0)
+    if accel_sps2 <= 0:
+        return np.full(steps, 0.5 * period_min)
+    i = np.arange(steps)
+    k = np.minimum(i, steps - 1 - i)
+    periods = np.sqrt(2.0 / accel_sps2) * (np.sqrt(k + 1) - np.sqrt(k))
+    return 0.5 * np.maximum(periods, period_min)
@@ -17,7 +17,7 @@ _NOT_VENDORED_MSG = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SnifferStatus:
     pid: Optional[int] = None
     running: bool = False
@@ -9,9 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import click
-import yaml
-from rich.console import Console
-from rich.table import Table
+
+from .config import load_config
 
 # Earth radius (km, WGS-84 equatorial) over GEO orbit radius (km).
 _EARTH_RADIUS_KM = 6378.137
@@ -21,7 +20,7 @@ _R_RATIO = _EARTH_RADIUS_KM / _GEO_RADIUS_KM  # ≈ 0.1512
 DEFAULT_CONFIG_PATH = Path("tracker/config.yaml")
 
 
-@dataclass
+@dataclass(slots=True)
 class Target:
     key: str
     name: str
@@ -112,10 +111,12 @@ def cli() -> None:
 )
 def list_cmd(config_path: Path) -> None:
     """List configured GEO targets with computed look-angles."""
+    from rich.console import Console  # lazy: keeps `import tracker.targets` light
+    from rich.table import Table
+
     if not config_path.exists():
         raise click.ClickException(f"Config file not found: {config_path}")
-    with config_path.open("r", encoding="utf-8") as f:
-        config = yaml.safe_load(f) or {}
+    config = load_config(config_path)
 
     targets = load_targets(config)
     site = config["site"]
@@ -19,7 +19,6 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, JSONResponse
 from pydantic import BaseModel
@@ -56,8 +55,8 @@ def _load_sniffer(sniffer_cfg: dict):
 
 
 def _read_config(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
+    from tracker.config import load_config  # lazy
+    return load_config(path)
 
 
 # --------------------------------------------------------------------------- #
@@ -216,8 +215,8 @@ async def api_set_limit(req: SetLimitReq) -> dict:
     cfg.setdefault("tracker", {}).setdefault(section_axis, {})
     cfg["tracker"][section_axis][f"{req.limit}_angle"] = current_deg
 
-    with CONFIG_PATH.open("w", encoding="utf-8") as fh:
-        yaml.safe_dump(cfg, fh, sort_keys=False, default_flow_style=False)
+    from tracker.config import save_config  # lazy
+    save_config(CONFIG_PATH, cfg)
 
     if req.limit == "min":
         axis_obj.min_angle = current_deg